@@ -0,0 +1,61 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Iterable, Optional
+
+
+def _map_texts(
+    func: Callable[[str], Any],
+    texts: Iterable[str],
+    n_jobs: int = 1,
+) -> list[Any]:
+    """Apply `func` to each text, optionally in worker processes.
+
+    Parameters
+    ----------
+    func : Callable[[str], Any]
+        Function to apply, e.g. a bound extractor method. With `n_jobs > 1` it
+        must be picklable; it is sent to each worker once.
+    texts : Iterable[str]
+        The input texts
+    n_jobs : int, default=1
+        Number of worker processes. 1 runs in the current process, -1 uses all CPUs.
+
+    Returns
+    -------
+    list[Any]
+        Results in the same order as `texts`
+
+    Raises
+    ------
+    ValueError
+        If `n_jobs` is not a positive integer or -1.
+    """
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    if n_jobs < 1:
+        raise ValueError(f"n_jobs must be a positive integer or -1, got {n_jobs}")
+    if n_jobs == 1:
+        return [func(text) for text in texts]
+
+    texts = list(texts)
+    # A few chunks per worker to balance uneven text lengths
+    chunksize = max(1, len(texts) // (n_jobs * 4))
+    with ProcessPoolExecutor(
+        max_workers=n_jobs,
+        initializer=_init_worker,
+        initargs=(func,),
+    ) as executor:
+        return list(executor.map(_call_worker, texts, chunksize=chunksize))
+
+
+# Set in each worker process of `_map_texts()`
+_worker_func: Optional[Callable[[str], Any]] = None
+
+
+def _init_worker(func: Callable[[str], Any]) -> None:
+    global _worker_func
+    _worker_func = func
+
+
+def _call_worker(text: str) -> Any:
+    return _worker_func(text)
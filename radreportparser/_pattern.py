@@ -1,5 +1,8 @@
+import contextlib
+import contextvars
+import functools
 import re
-from typing import Any, Literal, Optional, Union
+from typing import Any, Callable, Iterator, Literal, Optional, Union
 
 
 def _try_import_re2() -> Optional[Any]:
@@ -13,6 +16,19 @@ def _try_import_re2() -> Optional[Any]:
         return None
 
 
+def _require_re2() -> Any:
+    """
+    Import re2 module, raising ValueError if it is not installed.
+    """
+    regex_module = _try_import_re2()
+    if regex_module is None:
+        raise ValueError(
+            "The 're2' backend was requested but the package is not installed. "
+            "Please install it with 'pip install re2' or use the default 're' backend."
+        )
+    return regex_module
+
+
 def _pattern_keys(
     keys: list[str], 
     word_boundary: bool = True,
@@ -40,7 +56,12 @@ def _pattern_keys(
     Returns
     -------
     Any
-        Compiled regex pattern.
+        Compiled regex pattern. If all keys are plain strings, a
+        `_LiteralPattern` with the same `search()` and `finditer()` methods
+        is returned instead. With `re.IGNORECASE` and the
+        "re" backend, a `_CaseFoldPattern` searching lowercased text may be
+        returned. Patterns are cached, so calls with the same arguments return
+        the same object.
         
     Raises
     ------
@@ -49,6 +70,29 @@ def _pattern_keys(
     """
     if len(keys) == 0:
         raise ValueError("keys must have at least one element")
+    # Keys are immutable in the cache, and `int` flags keep its keys uniform.
+    # A repeated key can never match where its first occurrence failed, drop it
+    return _compile_keys(tuple(dict.fromkeys(keys)), word_boundary, int(flags), backend)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_keys(
+    keys: tuple[str, ...],
+    word_boundary: bool,
+    flags: int,
+    backend: Literal["re", "re2"],
+    ) -> Any:
+    """
+    Compile pattern for matching given keys, cached across calls.
+
+    See `_pattern_keys()` for the parameters. Identical keys and options reuse
+    the same compiled pattern (also for the "re2" backend, which has no
+    compile cache of its own).
+    """
+    if backend not in ("re", "re2"):
+        raise ValueError(f"Invalid backend: {backend}. Must be one of: 're', 're2'")
+    if backend == "re2":
+        _require_re2()
     
     # Create pattern string
     if word_boundary:
@@ -57,17 +101,59 @@ def _pattern_keys(
     else:
         # Regex pattern that matches any of the keys in the list
         pattern = rf"({'|'.join(keys)})"
-    
+
+    # Plain strings don't need the regex engine, use `str.find()` instead.
+    # Word boundaries are checked on each found key, as `\w` of `re` without
+    # `re.ASCII` (re2's `\b` is ASCII only)
+    literals = _literal_keys(keys, flags)
+    if literals is not None and not (
+        word_boundary and (flags & re.ASCII or backend == "re2")
+    ):
+        return _LiteralPattern(
+            literals,
+            flags,
+            regex=lambda: _compile_pattern(pattern, flags, backend),
+            word_boundary=word_boundary,
+        )
+
+    # `re` is slower with IGNORECASE than on lowercased text (re2 is not)
+    if backend == "re" and flags & re.IGNORECASE and not flags & re.VERBOSE:
+        lower_pattern = _lowercase_pattern(pattern)
+        if lower_pattern is not None:
+            return _CaseFoldPattern(
+                re.compile(lower_pattern, flags=flags & ~re.IGNORECASE),
+                ignorecase=lambda: re.compile(pattern, flags=flags),
+            )
+
+    return _compile_pattern(pattern, flags, backend)
+
+
+def _compile_pattern(
+    pattern: str,
+    flags: Union[re.RegexFlag, int] = re.IGNORECASE,
+    backend: Literal["re", "re2"] = "re"
+    ) -> Any:
+    """Compile regex pattern string with the given backend.
+
+    Parameters
+    ----------
+    pattern : str
+        Regex pattern string.
+    flags : Union[re.RegexFlag, int], default=re.IGNORECASE
+        Flags to use when compiling the pattern.
+    backend : {"re", "re2"}, default="re"
+        Regex backend to use.
+
+    Returns
+    -------
+    Any
+        Compiled regex pattern.
+    """
     # Determine which regex backend to use
     if backend == "re":
         return re.compile(pattern, flags=flags)
     elif backend == "re2":
-        regex_module = _try_import_re2()
-        if regex_module is None:
-            raise ValueError(
-                "The 're2' backend was requested but the package is not installed. "
-                "Please install it with 'pip install re2' or use the default 're' backend."
-            )
+        regex_module = _require_re2()
         
         # Convert re flags to re2 options
         options = regex_module.Options()
@@ -92,6 +178,418 @@ def _pattern_keys(
         raise ValueError(f"Invalid backend: {backend}. Must be one of: 're', 're2'")
     
 
+# Characters with special meaning in a regex (outside of re.VERBOSE)
+_REGEX_METACHARS = frozenset(".^$*+?{}[]\\|()")
+# Flags that don't change how a plain string is matched
+_LITERAL_SAFE_FLAGS = re.IGNORECASE | re.MULTILINE | re.DOTALL | re.ASCII | re.UNICODE
+
+
+def _literal_keys(
+    keys: list[str],
+    flags: Union[re.RegexFlag, int] = re.IGNORECASE,
+    ) -> Optional[tuple[str, ...]]:
+    """Get the plain strings matched by keys, if all keys match a plain string.
+
+    A key matches a plain string if it has no regex metacharacters, other
+    than backslash-escaped ones (e.g. the markdown header `\\*\\*FINDINGS:\\*\\*`).
+    With `re.IGNORECASE`, the strings must also be ASCII so that `str.lower()`
+    gives the same case folding as the regex engine.
+
+    Returns
+    -------
+    Optional[tuple[str, ...]]
+        The non-empty string matched by each key, or None if any key is a
+        regex pattern or the flags change how strings are matched.
+    """
+    if flags & ~_LITERAL_SAFE_FLAGS:
+        return None
+    ignorecase = bool(flags & re.IGNORECASE)
+    literals = []
+    for key in keys:
+        literal = _unescape_key(key)
+        if not literal:
+            return None
+        if ignorecase and not literal.isascii():
+            return None
+        literals.append(literal)
+    return tuple(literals)
+
+
+def _unescape_key(key: str) -> Optional[str]:
+    """Get the string matched by key, or None if key is a regex pattern."""
+    if "\\" not in key:
+        return None if _REGEX_METACHARS.intersection(key) else key
+    out = []
+    i, n = 0, len(key)
+    while i < n:
+        c = key[i]
+        if c == "\\":
+            # A backslash before an ASCII letter or digit is a special sequence
+            # (\w, \d, \1, ...), before any other character it is that character
+            if i + 1 >= n or (key[i + 1].isascii() and key[i + 1].isalnum()):
+                return None
+            out.append(key[i + 1])
+            i += 2
+        elif c in _REGEX_METACHARS:
+            return None
+        else:
+            out.append(c)
+            i += 1
+    return "".join(out)
+
+
+# `[text, lowercased text]` of the current extraction call, set by
+# `_sharing_lowered()` only while the call runs. A context variable is local
+# to each thread (and asyncio task), so concurrent calls don't share it
+_NOT_LOWERED = object()
+_shared_lowered: contextvars.ContextVar[Optional[list]] = contextvars.ContextVar(
+    "_shared_lowered", default=None
+)
+
+
+@contextlib.contextmanager
+def _sharing_lowered(text: str, shared: Optional[list] = None) -> Iterator[list]:
+    """Share the lowercased text between the searches of one extraction call.
+
+    Extracting a section searches the same text with several case-insensitive
+    patterns (start keys, then end keys once per section). Within this context,
+    `_lower_ascii()` lowercases `text` once rather than once per search.
+
+    Parameters
+    ----------
+    text : str
+        The text being extracted from.
+    shared : Optional[list]
+        The value yielded by an earlier context on the same text, to reuse its
+        lowercased text. Generators must leave the context before each `yield`
+        and re-enter it with `shared`, so contexts always exit in nesting order.
+
+    Yields
+    ------
+    list
+        The `[text, lowercased text]` shared by the searches.
+    """
+    current = _shared_lowered.get()
+    if current is not None and current[0] is text:
+        # Nested calls on the same text keep sharing it
+        yield current
+        return
+    if shared is None:
+        shared = [text, _NOT_LOWERED]
+    token = _shared_lowered.set(shared)
+    try:
+        yield shared
+    finally:
+        _shared_lowered.reset(token)
+
+
+def _lower_ascii(text: str) -> Optional[str]:
+    """Lowercase ASCII text, or return None if text is not ASCII.
+
+    The result is reused for the text of the enclosing `_sharing_lowered()`.
+    """
+    shared = _shared_lowered.get()
+    if shared is None or text is not shared[0]:
+        return text.lower() if text.isascii() else None
+    if shared[1] is _NOT_LOWERED:
+        shared[1] = text.lower() if text.isascii() else None
+    return shared[1]
+
+
+def _is_word_char(c: str) -> bool:
+    # Same as `\w` of `re` without `re.ASCII`
+    return c.isalnum() or c == "_"
+
+
+def _find_word(text: str, key: str, pos: int) -> int:
+    """`str.find()` of key in text that only accepts word-bounded matches.
+
+    A match at `text[i:j]` is accepted if both `i` and `j` are word
+    boundaries (`\\b`), i.e. the characters on each side differ in being
+    word characters, the text ends counting as non-word.
+    """
+    n = len(key)
+    i = text.find(key, pos)
+    while i != -1:
+        j = i + n
+        before = i > 0 and _is_word_char(text[i - 1])
+        after = j < len(text) and _is_word_char(text[j])
+        if before != _is_word_char(key[0]) and after != _is_word_char(key[-1]):
+            return i
+        i = text.find(key, i + 1)
+    return -1
+
+
+class _LiteralMatch:
+    """Minimal stand-in for `re.Match` returned by `_LiteralPattern`."""
+
+    __slots__ = ("_start", "_end")
+
+    def __init__(self, start: int, end: int):
+        self._start = start
+        self._end = end
+
+    def start(self) -> int:
+        return self._start
+
+    def end(self) -> int:
+        return self._end
+
+    def span(self) -> tuple[int, int]:
+        return self._start, self._end
+
+
+class _LiteralPattern:
+    """Match literal keys with `str.find()`, mimicking a compiled alternation.
+
+    Provides the `search()` and `finditer()` methods used on compiled patterns.
+    As with a regex alternation, the leftmost match wins and a tie goes to
+    the key listed first.
+
+    Parameters
+    ----------
+    keys : list[str]
+        Literal strings to match (see `_literal_keys()`).
+    flags : Union[re.RegexFlag, int]
+        Regex flags, only `re.IGNORECASE` changes the matching.
+    regex : Callable[[], Any]
+        Returns the equivalent compiled regex, used when `re.IGNORECASE` is set
+        and the text is not ASCII (`str.lower()` may change its length).
+    word_boundary : bool, default=False
+        Only match keys with a word boundary (`\\b`) on both sides, as the
+        `\\b(...)\\b` pattern of `_pattern_keys()` does.
+    """
+
+    def __init__(
+        self,
+        keys: list[str],
+        flags: Union[re.RegexFlag, int],
+        regex: Callable[[], Any],
+        word_boundary: bool = False,
+    ):
+        self.ignorecase = bool(flags & re.IGNORECASE)
+        self.keys = tuple(key.lower() for key in keys) if self.ignorecase else tuple(keys)
+        self.word_boundary = word_boundary
+        self._find_key = _find_word if word_boundary else str.find
+        self._regex_factory = regex
+        self._regex = None
+
+    def _fallback(self) -> Any:
+        if self._regex is None:
+            self._regex = self._regex_factory()
+        return self._regex
+
+    def _find(self, haystack: str, pos: int) -> Optional[_LiteralMatch]:
+        find_key = self._find_key
+        best_start = -1
+        best_end = -1
+        for key in self.keys:
+            i = find_key(haystack, key, pos)
+            if i != -1 and (best_start == -1 or i < best_start):
+                best_start, best_end = i, i + len(key)
+        if best_start == -1:
+            return None
+        return _LiteralMatch(best_start, best_end)
+
+    def search(self, text: str, pos: int = 0) -> Optional[Any]:
+        """Find the first match of any key in text, starting from `pos`."""
+        if self.ignorecase:
+            lower = _lower_ascii(text)
+            if lower is None:
+                return self._fallback().search(text, pos)
+            text = lower
+        return self._find(text, pos)
+
+    def finditer(self, text: str) -> Iterator[Any]:
+        """Iterate over all non-overlapping matches of the keys in text."""
+        if self.ignorecase:
+            lower = _lower_ascii(text)
+            if lower is None:
+                yield from self._fallback().finditer(text)
+                return
+            text = lower
+        keys = self.keys
+        find_key = self._find_key
+        # Next occurrence of each key, only searched again once a match passes
+        # it, so that each key scans the text once rather than once per match
+        found = [find_key(text, key, 0) for key in keys]
+        pos = 0
+        while True:
+            best_start = best_end = -1
+            for k, key in enumerate(keys):
+                i = found[k]
+                if i != -1 and i < pos:
+                    i = found[k] = find_key(text, key, pos)
+                if i != -1 and (best_start == -1 or i < best_start):
+                    best_start, best_end = i, i + len(key)
+            if best_start == -1:
+                return
+            yield _LiteralMatch(best_start, best_end)
+            pos = best_end
+
+
+# Characters allowed right after "(?" in a rewritable pattern
+_LOWERCASE_SAFE_GROUPS = (":", "=", "!", ">", "<=", "<!")
+_OCTAL_DIGITS = frozenset("01234567")
+
+
+def _lowercase_pattern(pattern: str) -> Optional[str]:
+    """Lowercase the letters matched literally by an ASCII regex pattern.
+
+    Searching lowercased ASCII text with the result, without `re.IGNORECASE`,
+    gives the same spans as searching the original text with `pattern` and
+    `re.IGNORECASE`. Escapes (`\\W`, `\\B`, ...) and group names are kept as is.
+
+    Parameters
+    ----------
+    pattern : str
+        Regex pattern string.
+
+    Returns
+    -------
+    Optional[str]
+        Lowercased pattern, or None if the rewrite is not known to be
+        equivalent (non-ASCII pattern, character code escapes, inline flags,
+        conditionals or ranges covering uppercase letters only).
+    """
+    if not pattern.isascii():
+        return None
+    out = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == "\\":
+            # Character codes (\x41, \u0041, \N{...}, octal \101) hide letters
+            # from the rewrite; keep other escapes as is (\W must stay \W)
+            if i + 1 >= n or pattern[i + 1] in "xuUN0":
+                return None
+            if len(pattern[i + 1:i + 4]) == 3 and set(pattern[i + 1:i + 4]) <= _OCTAL_DIGITS:
+                return None
+            out.append(pattern[i:i + 2])
+            i += 2
+        elif c == "(" and pattern.startswith("?", i + 1):
+            if pattern.startswith(("P<", "P="), i + 2):
+                # Named group: keep its name
+                close = pattern.find(">" if pattern[i + 3] == "<" else ")", i)
+                if close == -1:
+                    return None
+                out.append(pattern[i:close + 1])
+                i = close + 1
+            else:
+                prefix = next(
+                    (p for p in _LOWERCASE_SAFE_GROUPS if pattern.startswith(p, i + 2)),
+                    None,
+                )
+                if prefix is None:
+                    return None
+                out.append(pattern[i:i + 2 + len(prefix)])
+                i += 2 + len(prefix)
+        elif c == "[":
+            end = _lowercase_class(pattern, i, out)
+            if end is None:
+                return None
+            i = end
+        else:
+            out.append(c.lower())
+            i += 1
+    return "".join(out)
+
+
+def _lowercase_class(pattern: str, i: int, out: list[str]) -> Optional[int]:
+    """Lowercase the character class starting at `pattern[i]` into `out`.
+
+    Returns the index after the class, or None if it can't be rewritten.
+    """
+    n = len(pattern)
+    out.append("[")
+    i += 1
+    if pattern.startswith("^", i):
+        out.append("^")
+        i += 1
+    # "]" right after the opening bracket is a literal
+    first = True
+    while i < n:
+        c = pattern[i]
+        if c == "]" and not first:
+            out.append("]")
+            return i + 1
+        first = False
+        if c == "\\":
+            # Octal escapes are character codes inside a class; escapes can't
+            # be checked as range bounds
+            if i + 1 >= n or pattern[i + 1] in "xuUN01234567":
+                return None
+            if pattern.startswith("-", i + 2) and not pattern.startswith("]", i + 3):
+                return None
+            out.append(pattern[i:i + 2])
+            i += 2
+        elif (
+            i + 2 < n
+            and pattern[i + 1] == "-"
+            and pattern[i + 2] not in "]\\"
+        ):
+            lo, hi = c, pattern[i + 2]
+            if lo.isupper() and hi.isupper():
+                lo, hi = lo.lower(), hi.lower()
+            # Lowercased text has no uppercase letters: every uppercase letter
+            # in the range must have its lowercase in range too
+            for code in range(max(ord(lo), ord("A")), min(ord(hi), ord("Z")) + 1):
+                if not lo <= chr(code).lower() <= hi:
+                    return None
+            out.append(f"{lo}-{hi}")
+            i += 3
+        else:
+            out.append(c.lower())
+            i += 1
+    return None
+
+
+class _CaseFoldPattern:
+    """Case-insensitive pattern that avoids `re.IGNORECASE` on ASCII text.
+
+    Provides the `search()` and `finditer()` methods used on compiled patterns.
+    ASCII text is lowercased and searched with the lowercased pattern (see
+    `_lowercase_pattern()`); lowercasing keeps the length of ASCII text, so
+    match positions apply to the original text. The lowercased text is shared
+    with other patterns searching the same text (see `_lower_ascii()`).
+    Other text is searched with the `re.IGNORECASE` pattern, compiled on first
+    use. Only match positions are meaningful, matched groups come from the
+    lowercased text.
+
+    Parameters
+    ----------
+    lower : re.Pattern
+        Lowercased pattern compiled without `re.IGNORECASE`.
+    ignorecase : Callable[[], re.Pattern]
+        Returns the original pattern compiled with `re.IGNORECASE`, used when
+        the text is not ASCII.
+    """
+
+    def __init__(self, lower: re.Pattern, ignorecase: Callable[[], re.Pattern]):
+        self.lower = lower
+        self._ignorecase_factory = ignorecase
+        self._ignorecase = None
+
+    def _fallback(self) -> re.Pattern:
+        if self._ignorecase is None:
+            self._ignorecase = self._ignorecase_factory()
+        return self._ignorecase
+
+    def search(self, text: str, pos: int = 0) -> Optional[re.Match]:
+        """Find the first match in text, starting from `pos`."""
+        lower = _lower_ascii(text)
+        if lower is not None:
+            return self.lower.search(lower, pos)
+        return self._fallback().search(text, pos)
+
+    def finditer(self, text: str) -> Iterator[re.Match]:
+        """Iterate over all non-overlapping matches in text."""
+        lower = _lower_ascii(text)
+        if lower is not None:
+            return self.lower.finditer(lower)
+        return self._fallback().finditer(text)
+
+
 def _ensure_string(text: Any) -> str:
     """Convert input to string, handling various types safely.
     
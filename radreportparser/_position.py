@@ -1,170 +1,116 @@
-import re
 from typing import (
+    Any,
     List,
     Tuple,
-    Literal,
-    Union,
 )
-from ._pattern import (
-    _pattern_keys,
-    _ensure_string
-    )
 
 ## Start Position
 
-def _find_start_position_greedy(
+def _warn_multiple_start_matches(
     text: str,
-    keys: list[str] | None,
-    word_boundary: bool = False,
-    flags: Union[re.RegexFlag, int] = re.IGNORECASE,
+    keys: list[str],
+    key_patterns: list[Any],
     verbose: bool = True,
-    backend: Literal["re", "re2"] = "re",
-) -> tuple[int, int]:
-    """Helper function to find start position of the section
-    
+) -> None:
+    """Print a message for each start key that appears more than once in text.
+
     Parameters
     ----------
     text : str
         The input text to search through
-    keys : list[str] | None
+    keys : list[str]
         List of possible section start markers
-    word_boundary : bool, optional
-        Whether to use word boundaries in pattern matching
-    flags : Union[re.RegexFlag, int], optional
-        Regex flags to use in pattern matching.
-        For 're' backend: These are directly passed to re.compile()
-        For 're2' backend: These are converted to re2.Options properties
+    key_patterns : list[Any]
+        Compiled pattern of each key (without word boundary), in the same order
+        as `keys`, so the scan uses the same regex backend as the extraction
     verbose : bool, optional
         If True, prints warnings when multiple start matches are found
-    backend : {"re", "re2"}, optional
-        Regex backend to use:
-        - "re": Standard Python regex engine (default)
-        - "re2": Google's RE2 engine (must be installed)
-    
+    """
+    # Counting takes a full scan of text per key, only do it to print the message
+    if not verbose:
+        return
+    for key, pattern in zip(keys, key_patterns):
+        count = sum(1 for _ in pattern.finditer(text))
+        if count >= 2:
+            print(
+                f"Start pattern {key} appear {count} times in text, only the first one will be matched."
+            )
+
+
+def _search_start_position_greedy(
+    text: str,
+    pattern: Any,
+) -> tuple[int, int]:
+    """Find start position of the section using a precompiled pattern.
+
+    Parameters
+    ----------
+    text : str
+        The input text to search through
+    pattern : Any
+        Compiled regex pattern of the start keys, as returned by `_pattern_keys()`
+
     Returns
     -------
     tuple[int, int]
         A tuple containing (start, end) positions.
-        Returns (0, 0) if keys is None.
         Returns (-1, -1) if no matches found.
     """
-    # Convert text to string
-    text = _ensure_string(text)
-    
-    if keys is None:
-        return 0, 0
-        
-    # Warn if start pattern appears more than once
-    for key in keys:
-        x = re.findall(key, text, flags)
-        count = len(x)
-        if verbose and count >= 2:
-            print(
-                f"Start pattern {key} appear {count} times in text, only the first one will be matched."
-            )
-
-    start_match = _pattern_keys(keys, word_boundary, flags, backend=backend).search(text)
+    start_match = pattern.search(text)
     if not start_match:
         return -1, -1  # Indicate no match found
     return start_match.start(), start_match.end()
 
 
-def _find_start_position_greedy_all(
+def _search_start_position_greedy_all(
     text: str,
-    keys: list[str] | None,
-    word_boundary: bool = False,
-    flags: Union[re.RegexFlag, int] = re.IGNORECASE,
-    backend: Literal["re", "re2"] = "re",
+    pattern: Any,
 ) -> List[Tuple[int, int]]:
-    """Helper function to find all start positions of the sections.
+    """Find all start positions of the sections using a precompiled pattern.
 
     Parameters
     ----------
     text : str
         The input text to search through
-    keys : list[str] | None
-        List of possible section start markers
-    word_boundary : bool, optional
-        Whether to use word boundaries in pattern matching
-    flags : Union[re.RegexFlag, int], optional
-        Regex flags to use in pattern matching.
-        For 're' backend: These are directly passed to re.compile()
-        For 're2' backend: These are converted to re2.Options properties
-    backend : {"re", "re2"}, optional
-        Regex backend to use:
-        - "re": Standard Python regex engine (default)
-        - "re2": Google's RE2 engine (must be installed)
+    pattern : Any
+        Compiled regex pattern of the start keys, as returned by `_pattern_keys()`
 
     Returns
     -------
     List[Tuple[int, int]]
         List of tuples containing (start, end) positions of all matches.
-        Returns [(0, 0)] if keys is None.
         Returns [] if no matches found.
     """
-    # Convert text to string
-    text = _ensure_string(text)
-    
-    if keys is None:
-        return [(0, 0)]
+    return [(m.start(), m.end()) for m in pattern.finditer(text)]
 
-    pattern = _pattern_keys(keys, word_boundary, flags, backend=backend)
-    matches = list(pattern.finditer(text))
-    if not matches:
-        return []
 
-    return [(m.start(), m.end()) for m in matches]
-
-
-def _find_start_position_sequential(
+def _search_start_position_sequential(
     text: str,
-    keys: list[str] | None,
-    word_boundary: bool = False,
-    flags: Union[re.RegexFlag, int] = re.IGNORECASE,
+    keys: list[str],
+    patterns: list[Any],
     verbose: bool = True,
-    backend: Literal["re", "re2"] = "re",
 ) -> tuple[int, int]:
-    """Find the start position of a section using sequential matching.
-
-    Tries each start key in order and returns the position of the first successful match.
-    More precise when the order of keys matters.
+    """Find the start position of a section using precompiled patterns of each key.
 
     Parameters
     ----------
     text : str
         The input text to search through
-    keys : list[str] | None
-        List of possible start markers, tried in order
-    word_boundary : bool, optional
-        Whether to use word boundaries in pattern matching
-    flags : Union[re.RegexFlag, int], optional
-        Regex flags to use in pattern matching.
-        For 're' backend: These are directly passed to re.compile()
-        For 're2' backend: These are converted to re2.Options properties
+    keys : list[str]
+        List of possible start markers, used in messages
+    patterns : list[Any]
+        Compiled regex pattern of each key in `keys`, tried in order
     verbose : bool, optional
         If True, prints warning when multiple matches are found
-    backend : {"re", "re2"}, optional
-        Regex backend to use:
-        - "re": Standard Python regex engine (default)
-        - "re2": Google's RE2 engine (must be installed)
 
     Returns
     -------
     tuple[int, int]
         A tuple containing (start, end) positions.
-        Returns (0, 0) if keys is None.
         Returns (-1, -1) if no matches found.
     """
-    # Convert text to string
-    text = _ensure_string(text)
-    
-    if keys is None:
-        return 0, 0
-
     # Try each key in sequence
-    for key in keys:
-        # Create pattern for single key
-        pattern = _pattern_keys([key], word_boundary, flags, backend=backend)
+    for key, pattern in zip(keys, patterns):
         match = pattern.search(text)
 
         if match:
@@ -182,55 +128,29 @@ def _find_start_position_sequential(
     return -1, -1
 
 
-def _find_start_position_sequential_all(
+def _search_start_position_sequential_all(
     text: str,
-    keys: list[str] | None,
-    word_boundary: bool = False,
-    flags: Union[re.RegexFlag, int] = re.IGNORECASE,
-    backend: Literal["re", "re2"] = "re",
+    patterns: list[Any],
 ) -> List[Tuple[int, int]]:
-    """Find all start positions of sections using sequential matching.
-
-    Tries each start key in order and collects all successful matches.
-    This follows the sequential strategy where the order of keys matters.
+    """Find all start positions of sections using precompiled patterns of each key.
 
     Parameters
     ----------
     text : str
         The input text to search through
-    keys : list[str] | None
-        List of possible section start markers to try in order
-    word_boundary : bool, optional
-        Whether to use word boundaries in pattern matching
-    flags : Union[re.RegexFlag, int], optional
-        Regex flags to use in pattern matching.
-        For 're' backend: These are directly passed to re.compile()
-        For 're2' backend: These are converted to re2.Options properties
-    backend : {"re", "re2"}, optional
-        Regex backend to use:
-        - "re": Standard Python regex engine (default)
-        - "re2": Google's RE2 engine (must be installed)
+    patterns : list[Any]
+        Compiled regex pattern of each start key
 
     Returns
     -------
     List[Tuple[int, int]]
         List of tuples containing (start, end) positions of all matches.
-        Returns [(0, 0)] if keys is None.
         Returns [] if no matches found.
     """
-    # Convert text to string
-    text = _ensure_string(text)
-    
-    if keys is None:
-        return [(0, 0)]
-
     all_positions = []
     
     # Try each key in sequence
-    for key in keys:
-        # Create pattern for single key
-        pattern = _pattern_keys([key], word_boundary, flags, backend=backend)
-        
+    for pattern in patterns:
         # Find all matches for this key
         matches = list(pattern.finditer(text))
         if matches:
@@ -244,106 +164,59 @@ def _find_start_position_sequential_all(
 ## End Position
 
 
-def _find_end_position_greedy(
+def _search_end_position_greedy(
     text: str,
-    keys: list[str] | None,
+    pattern: Any,
     start_pos: int,
-    word_boundary: bool = False,
-    flags: Union[re.RegexFlag, int] = re.IGNORECASE,
-    backend: Literal["re", "re2"] = "re",
 ) -> int:
-    """Find the end position of a section using greedy matching.
-
-    Searches for any of the end keys and returns the position of the first match found.
-    This is faster but less precise when order matters.
+    """Find the end position of a section using a precompiled pattern.
 
     Parameters
     ----------
     text : str
         The input text to search through
-    keys : list[str] | None
-        List of possible end markers
+    pattern : Any
+        Compiled regex pattern of the end keys, as returned by `_pattern_keys()`
     start_pos : int
         Position in text to start searching from
-    word_boundary : bool, optional
-        Whether to use word boundaries in pattern matching
-    flags : Union[re.RegexFlag, int], optional
-        Regex flags to use in pattern matching.
-        For 're' backend: These are directly passed to re.compile()
-        For 're2' backend: These are converted to re2.Options properties
-    backend : {"re", "re2"}, optional
-        Regex backend to use:
-        - "re": Standard Python regex engine (default)
-        - "re2": Google's RE2 engine (must be installed)
 
     Returns
     -------
     int
         The ending position in the text
     """
-    # Convert text to string
-    text = _ensure_string(text)
-    
-    if keys is None:
-        return len(text)
-    end_match = _pattern_keys(keys, word_boundary, flags, backend=backend).search(text[start_pos:])
-    return len(text) if not end_match else start_pos + end_match.start()
+    # Search from `start_pos` in place rather than copying the tail of text
+    end_match = pattern.search(text, start_pos)
+    return len(text) if not end_match else end_match.start()
 
 
-def _find_end_position_sequential(
+def _search_end_position_sequential(
     text: str,
-    keys: list[str] | None,
+    patterns: list[Any],
     start_pos: int,
-    word_boundary: bool = False,
-    flags: Union[re.RegexFlag, int] = re.IGNORECASE,
-    backend: Literal["re", "re2"] = "re",
 ) -> int:
-    """Find the end position of a section using sequential matching.
-
-    Tries each end key in order and returns the position of the first successful match.
-    More precise when the order of keys matters.
+    """Find the end position of a section using precompiled patterns of each key.
 
     Parameters
     ----------
     text : str
         The input text to search through
-    keys : list[str] | None
-        List of possible end markers, tried in order
+    patterns : list[Any]
+        Compiled regex pattern of each end key, tried in order
     start_pos : int
         Position in text to start searching from
-    word_boundary : bool, optional
-        Whether to use word boundaries in pattern matching
-    flags : Union[re.RegexFlag, int], optional
-        Regex flags to use in pattern matching.
-        For 're' backend: These are directly passed to re.compile()
-        For 're2' backend: These are converted to re2.Options properties
-    backend : {"re", "re2"}, optional
-        Regex backend to use:
-        - "re": Standard Python regex engine (default)
-        - "re2": Google's RE2 engine (must be installed)
 
     Returns
     -------
     int
         The ending position in the text
     """
-    # Convert text to string
-    text = _ensure_string(text)
-    
-    if keys is None:
-        return len(text)
-
-    search_text = text[start_pos:]
-
     # Try each key in sequence
-    for key in keys:
-        # Create pattern for single key
-        pattern = _pattern_keys([key], word_boundary, flags, backend=backend)
-        match = pattern.search(search_text)
+    for pattern in patterns:
+        match = pattern.search(text, start_pos)
 
         if match:
-            # Return position relative to original text
-            return start_pos + match.start()
+            return match.start()
 
     # If no matches found, return end of text
     return len(text)
\ No newline at end of file
@@ -1,10 +1,14 @@
+import functools
 import re
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import List, Optional, Literal, Union
+from typing import Any, Iterable, Optional, Literal, Sequence, Union
 
 from .keyword import KeyWord
 from .report import RadReport
 from .section import SectionExtractor
+from ._pattern import _ensure_string, _sharing_lowered
+from ._batch import _map_texts
 
 
 @dataclass
@@ -15,15 +19,27 @@ class SectionConfig:
     ----------
     name : str
         Name of the section (e.g., "history", "findings")
-    start_keys : list[str]
+    start_keys : list[str] | None
         Keys that mark the start of this section
     next_section_keys : list[str] | None
         Keys that mark the start of the next sections
+
+    Notes
+    -----
+    Keys are stored as tuples, so they can't be changed in place. Assign new
+    keys instead, `RadReportExtractor()` uses them from the next extraction.
     """
 
     name: str
-    start_keys: List[str] | None
-    next_section_keys: Optional[List[str]] = None
+    start_keys: Optional[Sequence[str]]
+    next_section_keys: Optional[Sequence[str]] = None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # A new tuple on each assignment lets `RadReportExtractor()` notice
+        # changed keys by identity
+        if name in ("start_keys", "next_section_keys") and value is not None:
+            value = tuple(value)
+        object.__setattr__(self, name, value)
 
 
 class RadReportExtractor:
@@ -63,6 +79,11 @@ class RadReportExtractor:
         Regex backend to use:
         - "re": Standard Python regex engine (default)
         - "re2": Google's RE2 engine (must be installed)
+    cache_size : int, optional
+        Maximum number of extracted sections to memoize, keyed by the input text
+        and the extraction options. Useful when the same report texts are extracted
+        repeatedly (e.g., templated normal reports). Default is 0 (no caching),
+        since cached entries keep a reference to the report text.
 
     Methods
     -------
@@ -78,6 +99,8 @@ class RadReportExtractor:
         Extract findings/description section
     extract_impression(text, include_key=True, word_boundary=False)
         Extract impression/conclusion section
+    extract_all_batch(texts, n_jobs=1, include_key=False)
+        Extract all sections from many reports, optionally in parallel
 
     Examples
     --------
@@ -118,7 +141,14 @@ class RadReportExtractor:
     - Returns empty string if section is not found
     - Sections are extracted from their start marker until the next section marker
     - The last matched section continues until end of text
-    - If using the "re2" backend, you must have the re2 package installed
+    - If using the "re2" backend, you must have the re2 package installed. Keys that
+      are plain strings (no regex metacharacters) are searched with `str.find()` with
+      either backend (except re2 with `word_boundary=True`), the backend is only used
+      for the other keys
+    - With `cache_size > 0`, messages from `verbose` are only printed the first time
+      a section is extracted from a given text
+    - `backend` and the keys of `section_configs` can be changed after creation by
+      assigning new values; keys are tuples and can't be changed in place
     """
     def __init__(
         self,
@@ -129,8 +159,17 @@ class RadReportExtractor:
         keys_impression: list[str] = KeyWord.IMPRESSION.value,
         keys_footer: list[str] = KeyWord.FOOTER.value,
         backend: Literal["re", "re2"] = "re",
+        cache_size: int = 0,
     ):
+        # `SectionExtractor()` per section & matching options, so the patterns
+        # are compiled once per extractor rather than on every call. Each is
+        # stored with the section keys it was compiled from
+        self._section_extractors: dict[
+            tuple, tuple[Optional[tuple[str, ...]], Optional[tuple[str, ...]], SectionExtractor]
+        ] = {}
+        self._cache: OrderedDict[tuple, str] = OrderedDict()
         self.backend = backend
+        self.cache_size = cache_size
         self.section_configs = {
             "title": SectionConfig(
                 name="title",
@@ -175,27 +214,39 @@ class RadReportExtractor:
             ),
         }
 
-    def _extract_section_base(
+    @property
+    def backend(self) -> Literal["re", "re2"]:
+        return self._backend
+
+    @backend.setter
+    def backend(self, backend: Literal["re", "re2"]) -> None:
+        # Extractors & sections of the previous backend are stale
+        self._backend = backend
+        self._section_extractors.clear()
+        self._cache.clear()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Compiled patterns (re2, `str.find()` based) may not be picklable,
+        # they are rebuilt on first use after unpickling
+        state = self.__dict__.copy()
+        state["_section_extractors"] = {}
+        state["_cache"] = OrderedDict()
+        return state
+
+    def _get_section_extractor(
         self,
-        text: str,
-        start_keys: list[str] | None,
-        next_section_keys: list[str] | None,
+        section_name: str,
         include_key: bool = True,
         word_boundary: bool = False,
         flags: Union[re.RegexFlag, int] = re.IGNORECASE,
         match_strategy: Literal["greedy", "sequential"] = "greedy",
-        verbose: bool = True,
-    ) -> str:
-        """Base method for extracting sections from radiology report text.
+    ) -> SectionExtractor:
+        """Get the `SectionExtractor()` of a section, creating it on first use.
 
         Parameters
         ----------
-        text : str
-            The input radiology report text
-        start_keys : list[str]
-            List of possible section start markers
-        next_section_keys : list[str] | None
-            List of possible next section markers that would end the current section
+        section_name : str
+            Name of the section in `section_configs`
         include_key : bool
             Whether to include the section key in output
         word_boundary : bool
@@ -206,25 +257,40 @@ class RadReportExtractor:
             For 're2' backend: These are converted to re2.Options properties
         match_strategy : {"greedy", "sequential"}
             Strategy for matching end keys
-        verbose : bool, optional
-            If True, prints messages if multiple start matches are found.
-            Default is True.
 
         Returns
         -------
-        str
-            The extracted section text. Returns empty string if section not found.
+        SectionExtractor
+            The cached extractor for the section and options.
         """
+        config = self.section_configs.get(section_name)
+        if not config:
+            raise ValueError(f"Unknown section: {section_name}")
+        cache_key = (section_name, include_key, word_boundary, flags, match_strategy)
+        cached = self._section_extractors.get(cache_key)
+        # Assigned keys are new tuples (see `SectionConfig()`)
+        if (
+            cached is not None
+            and cached[0] is config.start_keys
+            and cached[1] is config.next_section_keys
+        ):
+            return cached[2]
+        if cached is not None:
+            # Sections memoized with the old keys are stale
+            self._cache.clear()
         extractor = SectionExtractor(
-            start_keys=start_keys,
-            end_keys=next_section_keys,
+            start_keys=config.start_keys,
+            end_keys=config.next_section_keys,
             include_start_keys=include_key,
             word_boundary=word_boundary,
             flags=flags,
             match_strategy=match_strategy,
             backend=self.backend,
         )
-        return extractor.extract(text, verbose=verbose)
+        self._section_extractors[cache_key] = (
+            config.start_keys, config.next_section_keys, extractor
+        )
+        return extractor
 
     def _extract_section_by_name(
         self,
@@ -238,26 +304,37 @@ class RadReportExtractor:
     ) -> str:
         """Extract a section by name from the radiology report text.
         """
-        config = self.section_configs.get(section_name)
-        if not config:
-            raise ValueError(f"Unknown section: {section_name}")
-
-        return self._extract_section_base(
-            text,
-            start_keys=config.start_keys,
-            next_section_keys=config.next_section_keys,
+        extractor = self._get_section_extractor(
+            section_name,
             include_key=include_key,
             word_boundary=word_boundary,
             flags=flags,
             match_strategy=match_strategy,
-            verbose=verbose,
         )
+        if self.cache_size <= 0:
+            return extractor.extract(text, verbose=verbose)
+
+        # Memoize by text & options, evicting the least recently used entry
+        text = _ensure_string(text)
+        cache_key = (text, section_name, include_key, word_boundary, flags, match_strategy)
+        section = self._cache.get(cache_key)
+        if section is not None:
+            self._cache.move_to_end(cache_key)
+            return section
+        section = extractor.extract(text, verbose=verbose)
+        self._cache[cache_key] = section
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return section
 
     def extract_all(
         self,
         text: str,
         include_key: bool = False,
-        **kwargs,
+        word_boundary: bool = False,
+        flags: Union[re.RegexFlag, int] = re.IGNORECASE,
+        match_strategy: Literal["greedy", "sequential"] = "greedy",
+        verbose: bool = True,
     ) -> RadReport:
         """Extract all sections from the radiology report text.
 
@@ -270,8 +347,15 @@ class RadReportExtractor:
             The input radiology report text
         include_key : bool, optional
             Whether to include section keys in output, by default False
-        **kwargs
-            Parameters passed to all child functions
+        word_boundary : bool, optional
+            Whether to wrap word boundary `\b` around the section keys, by default False
+        flags : Union[re.RegexFlag, int], optional
+            Regex flags to use in pattern matching, by default re.IGNORECASE
+        match_strategy : {"greedy", "sequential"}, optional
+            Strategy for matching end keys, by default "greedy"
+        verbose : bool, optional
+            If True, prints messages if multiple start matches are found.
+            Default is True.
 
         Returns
         -------
@@ -353,37 +437,130 @@ class RadReportExtractor:
         report.to_json()
         ```
         """
-        return RadReport(
-            title=self.extract_title(
-                text,
-                **kwargs,
-            ),
-            history=self.extract_history(
-                text,
-                include_key=include_key,
-                **kwargs,
-            ),
-            technique=self.extract_technique(
-                text,
-                include_key=include_key,
-                **kwargs,
-            ),
-            comparison=self.extract_comparison(
-                text,
-                include_key=include_key,
-                **kwargs,
-            ),
-            findings=self.extract_findings(
-                text,
-                include_key=include_key,
-                **kwargs,
-            ),
-            impression=self.extract_impression(
-                text,
-                include_key=include_key,
-                **kwargs,
-            ),
+        # Lowercase the text once for all sections, rather than once per section
+        text = _ensure_string(text)
+        with _sharing_lowered(text):
+            return RadReport(
+                title=self.extract_title(
+                    text,
+                    word_boundary=word_boundary,
+                    flags=flags,
+                    match_strategy=match_strategy,
+                    verbose=verbose,
+                ),
+                history=self.extract_history(
+                    text,
+                    include_key=include_key,
+                    word_boundary=word_boundary,
+                    flags=flags,
+                    match_strategy=match_strategy,
+                    verbose=verbose,
+                ),
+                technique=self.extract_technique(
+                    text,
+                    include_key=include_key,
+                    word_boundary=word_boundary,
+                    flags=flags,
+                    match_strategy=match_strategy,
+                    verbose=verbose,
+                ),
+                comparison=self.extract_comparison(
+                    text,
+                    include_key=include_key,
+                    word_boundary=word_boundary,
+                    flags=flags,
+                    match_strategy=match_strategy,
+                    verbose=verbose,
+                ),
+                findings=self.extract_findings(
+                    text,
+                    include_key=include_key,
+                    word_boundary=word_boundary,
+                    flags=flags,
+                    match_strategy=match_strategy,
+                    verbose=verbose,
+                ),
+                impression=self.extract_impression(
+                    text,
+                    include_key=include_key,
+                    word_boundary=word_boundary,
+                    flags=flags,
+                    match_strategy=match_strategy,
+                    verbose=verbose,
+                ),
+            )
+
+    def extract_all_batch(
+        self,
+        texts: Iterable[str],
+        n_jobs: int = 1,
+        include_key: bool = False,
+        word_boundary: bool = False,
+        flags: Union[re.RegexFlag, int] = re.IGNORECASE,
+        match_strategy: Literal["greedy", "sequential"] = "greedy",
+        verbose: bool = True,
+    ) -> list[RadReport]:
+        """Extract all sections from many radiology report texts.
+
+        Equivalent to `[self.extract_all(text, ...) for text in texts]`, with the
+        option to spread the reports over worker processes.
+
+        Parameters
+        ----------
+        texts : Iterable[str]
+            The input radiology report texts
+        n_jobs : int, optional
+            Number of worker processes. Default is 1 (extract in the current process).
+            -1 uses all CPUs.
+        include_key : bool, optional
+            Whether to include section keys in output, by default False
+        word_boundary : bool, optional
+            Whether to wrap word boundary `\b` around the section keys, by default False
+        flags : Union[re.RegexFlag, int], optional
+            Regex flags to use in pattern matching, by default re.IGNORECASE
+        match_strategy : {"greedy", "sequential"}, optional
+            Strategy for matching end keys, by default "greedy"
+        verbose : bool, optional
+            If True, prints messages if multiple start matches are found.
+            Default is True.
+
+        Returns
+        -------
+        list[RadReport]
+            RadReport objects in the same order as `texts`
+
+        Notes
+        -----
+        Regex matching holds the GIL, so parallel extraction uses processes rather
+        than threads. The extractor is sent to each worker once; starting the workers
+        costs far more than extracting a single report, so `n_jobs > 1` only pays off
+        for large batches.
+
+        Examples
+        --------
+
+        ```{python}
+        from radreportparser import RadReportExtractor
+        extractor = RadReportExtractor()
+        text = '''
+        HISTORY: Headache
+        FINDINGS: Normal study
+        IMPRESSION: No acute abnormality
+        '''
+        reports = extractor.extract_all_batch([text, "IMPRESSION: Benign cyst"])
+        reports[1].impression
+        ```
+        """
+        extract = functools.partial(
+            self.extract_all,
+            include_key=include_key,
+            word_boundary=word_boundary,
+            flags=flags,
+            match_strategy=match_strategy,
+            verbose=verbose,
         )
+        return _map_texts(extract, texts, n_jobs=n_jobs)
+
     def extract_title(
         self,
         text: str,
@@ -670,4 +847,4 @@ class RadReportExtractor:
             flags=flags,
             match_strategy=match_strategy,
             verbose=verbose,
-        )
\ No newline at end of file
+        )
@@ -1,8 +1,8 @@
-from dataclasses import dataclass, asdict
-from typing import Optional, Dict, Any
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, Literal
 import json
 
-@dataclass
+@dataclass(slots=True)
 class RadReport:
     """A dataclass representing a radiology report
 
@@ -75,12 +75,25 @@ class RadReport:
         >>> report.to_dict(exclude_none=True)
         {'title': 'CT BRAIN', 'findings': 'Normal'}
         """
-        d = asdict(self)
+        # Fields are all `str` or `None`, so no need for the deep copy of `asdict()`
+        d = {
+            "title": self.title,
+            "history": self.history,
+            "technique": self.technique,
+            "comparison": self.comparison,
+            "findings": self.findings,
+            "impression": self.impression,
+        }
         if exclude_none:
             return {k: v for k, v in d.items() if v is not None}
         return d
 
-    def to_json(self, exclude_none: bool = False, **kwargs) -> str:
+    def to_json(
+        self,
+        exclude_none: bool = False,
+        backend: Literal["json", "orjson"] = "json",
+        **kwargs,
+    ) -> str:
         """Convert the RadReport to a JSON string.
 
         Similar to pandas DataFrame.to_json(), this method converts
@@ -91,17 +104,29 @@ class RadReport:
         exclude_none : bool, optional
             If True, excludes keys with None values from the output JSON.
             If False, includes all keys (default).
+        backend : {"json", "orjson"}, optional
+            JSON library to use:
+            - "json": Python's standard library (default)
+            - "orjson": The faster `orjson` package (must be installed). Output is
+              compact and non-ASCII characters are not escaped.
         **kwargs : dict
             Additional keyword arguments to pass to json.dumps().
             Common options include:
             - indent: int, for pretty printing
             - sort_keys: bool, to sort keys alphabetically
+            The "orjson" backend only supports `indent=2` and `sort_keys`.
 
         Returns
         -------
         str
             A JSON string representation of the report.
 
+        Raises
+        ------
+        ValueError
+            If backend is "orjson" but orjson is not installed, or if `kwargs`
+            has options that orjson does not support.
+
         Examples
         --------
         >>> report = RadReport(title="CT BRAIN", findings="Normal")
@@ -115,8 +140,48 @@ class RadReport:
           "impression": null
         }
         >>> print(report.to_json(exclude_none=True))
+        {"title": "CT BRAIN", "findings": "Normal"}
+        >>> print(report.to_json(exclude_none=True, backend="orjson"))
         {"title":"CT BRAIN","findings":"Normal"}
         """
-        return json.dumps(self.to_dict(exclude_none=exclude_none), **kwargs)
+        d = self.to_dict(exclude_none=exclude_none)
+        if backend == "json":
+            return json.dumps(d, **kwargs)
+        elif backend == "orjson":
+            return _orjson_dumps(d, **kwargs)
+        else:
+            raise ValueError(f"Invalid backend: {backend}. Must be one of: 'json', 'orjson'")
+
+
+def _try_import_orjson() -> Optional[Any]:
+    """
+    Try to import orjson module and return it if successful.
+    """
+    try:
+        import orjson
+        return orjson
+    except ImportError:
+        return None
+
+
+def _orjson_dumps(d: Dict[str, Any], indent: Optional[int] = None, sort_keys: bool = False, **kwargs) -> str:
+    """Serialize dict to JSON string with orjson, mapping the supported json.dumps() options."""
+    orjson = _try_import_orjson()
+    if orjson is None:
+        raise ValueError(
+            "The 'orjson' backend was requested but the package is not installed. "
+            "Please install it with 'pip install orjson' or use the default 'json' backend."
+        )
+    if kwargs:
+        raise ValueError(f"Options not supported by the 'orjson' backend: {', '.join(kwargs)}")
+    if indent not in (None, 2):
+        raise ValueError("The 'orjson' backend only supports indent=2")
+
+    option = 0
+    if indent == 2:
+        option |= orjson.OPT_INDENT_2
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    return orjson.dumps(d, option=option).decode()
 
 
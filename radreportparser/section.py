@@ -1,16 +1,34 @@
 import re
 from typing import (
+    Any,
+    Iterable,
+    Iterator,
     Literal,
     List,
+    Optional,
     Union,
 )
+from ._pattern import (
+    _pattern_keys,
+    _ensure_string,
+    _sharing_lowered,
+)
+from ._batch import _map_texts
 from ._position import (
-    _find_start_position_greedy,
-    _find_start_position_sequential,
-    _find_start_position_greedy_all,
-    _find_end_position_greedy,
-    _find_end_position_sequential,
-    _find_start_position_sequential_all
+    _search_start_position_sequential,
+    _search_end_position_sequential,
+    _search_start_position_sequential_all,
+    _warn_multiple_start_matches,
+    _search_start_position_greedy,
+    _search_start_position_greedy_all,
+    _search_end_position_greedy,
+)
+
+# Values of `match_strategy`, in the order listed in error messages
+_MATCH_STRATEGIES = ("greedy", "sequential")
+# Options of `SectionExtractor()` that its compiled patterns & finders depend on
+_COMPILED_OPTIONS = frozenset(
+    ("start_keys", "end_keys", "word_boundary", "flags", "match_strategy", "backend")
 )
 
 
@@ -64,6 +82,11 @@ class SectionExtractor:
         - "re": Standard Python regex engine (default)
         - "re2": Google's RE2 engine (must be installed)
 
+    Notes
+    -----
+    The start and end keys are compiled once when the extractor is created, so reuse
+    one `SectionExtractor()` when extracting from many texts.
+
     Examples
     --------
     ```{python}
@@ -77,6 +100,27 @@ class SectionExtractor:
     ```
     """
 
+    # Options given to `__init__()`, the rest are compiled from them
+    _OPTIONS = (
+        "start_keys",
+        "end_keys",
+        "include_start_keys",
+        "word_boundary",
+        "flags",
+        "match_strategy",
+        "backend",
+    )
+    __slots__ = _OPTIONS + (
+        "_start_pattern",
+        "_end_pattern",
+        "_start_key_patterns",
+        "_start_patterns_sequential",
+        "_end_patterns_sequential",
+        "_find_start",
+        "_find_starts",
+        "_find_end",
+    )
+
     def __init__(
         self,
         start_keys: list[str] | None,
@@ -93,15 +137,81 @@ class SectionExtractor:
         self.word_boundary = word_boundary
         self.flags = flags
         self.backend = backend
+        self.match_strategy = match_strategy
+        self._compile_patterns()
 
+    def __setattr__(self, name: str, value: Any) -> None:
         # Validate match strategy
-        match_strategy_options = frozenset({"greedy", "sequential"})
-        if match_strategy not in match_strategy_options:
+        if name == "match_strategy" and value not in _MATCH_STRATEGIES:
             raise ValueError(
-                f"Invalid value: {match_strategy}. "
-                f"Must be one of: {', '.join(match_strategy_options)}"
+                f"Invalid value: {value}. "
+                f"Must be one of: {', '.join(_MATCH_STRATEGIES)}"
             )
-        self.match_strategy = match_strategy
+        object.__setattr__(self, name, value)
+        # Options assigned after `__init__()` must change the compiled patterns too
+        if name in _COMPILED_OPTIONS and hasattr(self, "_find_end"):
+            self._compile_patterns()
+
+    def _compile_patterns(self) -> None:
+        """Compile the start & end patterns once for reuse across `extract()` calls."""
+        greedy = self.match_strategy == "greedy"
+        # All start & end keys in one pattern, used by the greedy strategy
+        self._start_pattern = self._compile_keys(self.start_keys) if greedy else None
+        self._end_pattern = self._compile_keys(self.end_keys) if greedy else None
+        # Each start key on its own, to check for repeated start matches
+        self._start_key_patterns = (
+            [
+                _pattern_keys([key], False, self.flags, backend=self.backend)
+                for key in self.start_keys
+            ]
+            if self.start_keys is not None and greedy
+            else None
+        )
+        # Each start & end key on its own, tried in order by the sequential strategy
+        self._start_patterns_sequential = self._compile_each_key(self.start_keys)
+        self._end_patterns_sequential = self._compile_each_key(self.end_keys)
+        # Pick the strategy's finders once rather than on every call. Without
+        # keys, the section starts at the beginning or ends at the end of text
+        if self.start_keys is None:
+            self._find_start = self._find_start_none
+            self._find_starts = self._find_starts_none
+        elif greedy:
+            self._find_start = self._find_start_greedy
+            self._find_starts = self._find_starts_greedy
+        else:
+            self._find_start = self._find_start_sequential
+            self._find_starts = self._find_starts_sequential
+        if self.end_keys is None:
+            self._find_end = self._find_end_none
+        elif greedy:
+            self._find_end = self._find_end_greedy
+        else:
+            self._find_end = self._find_end_sequential
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Compiled patterns (re2, `str.find()` based) may not be picklable,
+        # they are compiled again when unpickling
+        return {name: getattr(self, name) for name in self._OPTIONS}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._compile_patterns()
+
+    def _compile_keys(self, keys: list[str] | None):
+        """Compile keys into a single pattern, or return None if keys is None."""
+        if keys is None:
+            return None
+        return _pattern_keys(keys, self.word_boundary, self.flags, backend=self.backend)
+
+    def _compile_each_key(self, keys: list[str] | None):
+        """Compile each key into its own pattern for the sequential strategy.
+
+        Returns None if keys is None or the strategy is greedy.
+        """
+        if keys is None or self.match_strategy != "sequential":
+            return None
+        return [self._compile_keys([key]) for key in keys]
 
     def __repr__(self) -> str:
         """Return a detailed string representation of the SectionExtractor."""
@@ -169,52 +279,60 @@ class SectionExtractor:
         print(section)
         ```
         """
-        # Find start position based on strategy
-        if self.match_strategy == "greedy":
-            start_idx_start, start_idx_end = _find_start_position_greedy(
-                text,
-                self.start_keys,
-                word_boundary=self.word_boundary,
-                flags=self.flags,
-                verbose=verbose,
-                backend=self.backend,
-            )
-        else:
-            start_idx_start, start_idx_end = _find_start_position_sequential(
-                text,
-                self.start_keys,
-                word_boundary=self.word_boundary,
-                flags=self.flags,
-                verbose=verbose,
-                backend=self.backend,
-            )
-
-        if start_idx_start == -1:  # No start match found
+        text = _ensure_string(text)
+        with _sharing_lowered(text):
+            span = self._extract_span(text, verbose=verbose)
+        if span is None:  # No start match found
             return ""
+        return text[span[0]:span[1]].strip()
 
-        # Find end position based on strategy
-        if self.match_strategy == "greedy":
-            end_idx = _find_end_position_greedy(
-                text,
-                self.end_keys,
-                start_idx_start,
-                word_boundary=self.word_boundary,
-                flags=self.flags,
-                backend=self.backend,
-            )
-        else:
-            end_idx = _find_end_position_sequential(
-                text,
-                self.end_keys,
-                start_idx_start,
-                word_boundary=self.word_boundary,
-                flags=self.flags,
-                backend=self.backend,
-            )
+    def extract_span(
+        self,
+        text: str,
+        verbose: bool = True,
+    ) -> Optional[tuple[int, int]]:
+        """Find the position of the section in the text.
 
-        # Extract the section
-        section_start = start_idx_start if self.include_start_keys else start_idx_end
-        return text[section_start:end_idx].strip()
+        Same as `extract()`, but returns the `(start, end)` indices of the section
+        instead of its text, so that `text[start:end]` is the extracted section.
+
+        Parameters
+        ----------
+        text : str
+            The input text to find the section in.
+        verbose : bool
+            If `true` and there are more than one position of `text` that matches the `start_keys`, print message to standard output. 
+
+        Returns
+        -------
+        Optional[tuple[int, int]]
+            The start and end indices of the section, without surrounding whitespace.
+            Returns None if section not found.
+
+        Examples
+        --------
+        ```{python}
+        from radreportparser import SectionExtractor
+        extractor = SectionExtractor(
+            start_keys=["FINDINGS:"],
+            end_keys=["IMPRESSION:"]
+        )
+        text = "FINDINGS: Normal. IMPRESSION: Clear."
+        start, end = extractor.extract_span(text)
+        print(start, end, text[start:end])
+        ```
+        """
+        text = _ensure_string(text)
+        with _sharing_lowered(text):
+            span = self._extract_span(text, verbose=verbose)
+        if span is None:
+            return None
+        # Narrow the span to match `str.strip()` of the section
+        start, end = span
+        section = text[start:end]
+        stripped = section.lstrip()
+        start += len(section) - len(stripped)
+        return start, start + len(stripped.rstrip())
 
     def extract_all(self, text: str) -> List[str]:
         """Extract all sections from the text that match the configured patterns.
@@ -252,56 +370,150 @@ class SectionExtractor:
         print(sections)
         ```
         """
-        # Find all start positions based on strategy
-        if self.match_strategy == "greedy":
-            start_positions = _find_start_position_greedy_all(
-                text, 
-                self.start_keys, 
-                self.word_boundary, 
-                self.flags,
-                backend=self.backend,
-            )
-        else:
-            start_positions = _find_start_position_sequential_all(
-                text, 
-                self.start_keys, 
-                self.word_boundary, 
-                self.flags,
-                backend=self.backend,
-            )
+        return list(self.iter_extract(text))
+
+    def iter_extract(self, text: str) -> Iterator[str]:
+        """Iterate over the sections of the text that match the configured patterns.
 
-        if not start_positions:
-            return []
+        Same as `extract_all()`, but yields each section as it is found, so
+        that callers needing only the first few sections can stop early.
+
+        Parameters
+        ----------
+        text : str
+            The input text to extract sections from
 
-        sections = []
+        Yields
+        ------
+        str
+            Extracted section texts, in order of their start key in the text.
+
+        Examples
+        --------
+        ```{python}
+        from radreportparser import SectionExtractor
+        extractor = SectionExtractor(
+            start_keys=["FINDING:"],
+            end_keys=["IMPRESSION:"]
+        )
+        text = "FINDING: First IMPRESSION: OK FINDING: Second IMPRESSION: OK"
+        print(next(extractor.iter_extract(text)))
+        ```
+        """
+        text = _ensure_string(text)
+        find_end = self._find_end
+        include_start_keys = self.include_start_keys
+
+        # Lowercase the text once for all searches, but leave the context before
+        # each `yield`: the caller may extract from other texts in between
+        with _sharing_lowered(text) as shared:
+            starts = self._find_starts(text)
 
         # Process each start position
-        for start_idx_start, start_idx_end in start_positions:
-            # Find end position based on strategy
-            if self.match_strategy == "greedy":
-                end_idx = _find_end_position_greedy(
-                    text, 
-                    self.end_keys, 
-                    start_idx_start, 
-                    self.word_boundary, 
-                    self.flags,
-                    backend=self.backend,
-                )
-            else:
-                end_idx = _find_end_position_sequential(
-                    text, 
-                    self.end_keys, 
-                    start_idx_start, 
-                    self.word_boundary, 
-                    self.flags,
-                    backend=self.backend,
-                )
+        end_idx = -1
+        for start_idx_start, start_idx_end in starts:
+            # Start positions are in text order, so the first end match after
+            # the previous start is still the first one if it's not behind this start
+            if end_idx < start_idx_start:
+                with _sharing_lowered(text, shared):
+                    end_idx = find_end(text, start_idx_start)
 
             # Extract the section
-            section_start = start_idx_start if self.include_start_keys else start_idx_end
+            section_start = start_idx_start if include_start_keys else start_idx_end
             section = text[section_start:end_idx].strip()
 
-            if section:  # Only add non-empty sections
-                sections.append(section)
+            if section:  # Only yield non-empty sections
+                yield section
+
+    def extract_all_batch(self, texts: Iterable[str], n_jobs: int = 1) -> List[List[str]]:
+        """Extract all sections from each of many texts.
+
+        Equivalent to `[self.extract_all(text) for text in texts]`, with the option
+        to spread the texts over worker processes.
+
+        Parameters
+        ----------
+        texts : Iterable[str]
+            The input texts to extract sections from
+        n_jobs : int, optional
+            Number of worker processes. Default is 1 (extract in the current process).
+            -1 uses all CPUs.
+
+        Returns
+        -------
+        List[List[str]]
+            Extracted sections of each text, in the same order as `texts`.
+
+        Examples
+        --------
+        ```{python}
+        from radreportparser import SectionExtractor
+        extractor = SectionExtractor(
+            start_keys=["FINDING:"],
+            end_keys=["IMPRESSION:"]
+        )
+        texts = ["FINDING: First IMPRESSION: OK", "FINDING: Second"]
+        print(extractor.extract_all_batch(texts))
+        ```
+        """
+        return _map_texts(self.extract_all, texts, n_jobs=n_jobs)
+
+    def _extract_span(self, text: str, verbose: bool = True) -> Optional[tuple[int, int]]:
+        """Find the `(start, end)` of the section before stripping, or None if not found."""
+        start_idx_start, start_idx_end = self._find_start(text, verbose=verbose)
+
+        if start_idx_start == -1:  # No start match found
+            return None
+        return self._section_span(text, start_idx_start, start_idx_end)
+
+    def _section_span(
+        self, text: str, start_idx_start: int, start_idx_end: int
+    ) -> tuple[int, int]:
+        """Find the `(start, end)` of the section starting at the given start key match."""
+        end_idx = self._find_end(text, start_idx_start)
+        section_start = start_idx_start if self.include_start_keys else start_idx_end
+        return section_start, end_idx
+
+    @staticmethod
+    def _find_start_none(text: str, verbose: bool = True) -> tuple[int, int]:
+        """Start the section at the beginning of the text (no start keys)."""
+        return 0, 0
+
+    @staticmethod
+    def _find_starts_none(text: str) -> list[tuple[int, int]]:
+        """Start the only section at the beginning of the text (no start keys)."""
+        return [(0, 0)]
+
+    @staticmethod
+    def _find_end_none(text: str, start_pos: int) -> int:
+        """End the section at the end of the text (no end keys)."""
+        return len(text)
+
+    def _find_start_greedy(self, text: str, verbose: bool = True) -> tuple[int, int]:
+        """Find the start position with the compiled start pattern (greedy strategy)."""
+        _warn_multiple_start_matches(
+            text, self.start_keys, self._start_key_patterns, verbose=verbose
+        )
+        return _search_start_position_greedy(text, self._start_pattern)
+
+    def _find_start_sequential(self, text: str, verbose: bool = True) -> tuple[int, int]:
+        """Find the start position trying each compiled start key in order (sequential strategy)."""
+        return _search_start_position_sequential(
+            text, self.start_keys, self._start_patterns_sequential, verbose=verbose
+        )
+
+    def _find_starts_greedy(self, text: str) -> list[tuple[int, int]]:
+        """Find all start positions with the compiled start pattern (greedy strategy)."""
+        return _search_start_position_greedy_all(text, self._start_pattern)
+
+    def _find_starts_sequential(self, text: str) -> list[tuple[int, int]]:
+        """Find all start positions of each compiled start key (sequential strategy)."""
+        return _search_start_position_sequential_all(text, self._start_patterns_sequential)
+
+    def _find_end_greedy(self, text: str, start_pos: int) -> int:
+        """Find the end position with the compiled end pattern (greedy strategy)."""
+        return _search_end_position_greedy(text, self._end_pattern, start_pos)
 
-        return sections
\ No newline at end of file
+    def _find_end_sequential(self, text: str, start_pos: int) -> int:
+        """Find the end position trying each compiled end key in order (sequential strategy)."""
+        return _search_end_position_sequential(text, self._end_patterns_sequential, start_pos)
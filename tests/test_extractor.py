@@ -0,0 +1,125 @@
+import pytest
+import re
+from radreportparser import RadReportExtractor, SectionExtractor, is_re2_available
+
+# Test Data
+REPORT_TEXT = """EMERGENCY CT BRAIN
+
+HISTORY: 25F, dizziness and LOC
+
+TECHNIQUE: CT brain without contrast
+
+COMPARISON: None.
+
+FINDINGS: Normal study
+- No hemorrhage
+
+IMPRESSION: No acute abnormality"""
+
+@pytest.fixture(scope="module")
+def report_text():
+    return REPORT_TEXT
+
+def test_extract_all_basic(report_text):
+    """Test extracting all sections"""
+    report = RadReportExtractor().extract_all(report_text)
+    assert report.title == "EMERGENCY CT BRAIN"
+    assert report.history == "25F, dizziness and LOC"
+    assert report.technique == "CT brain without contrast"
+    assert report.comparison == "None."
+    assert report.findings == "Normal study\n- No hemorrhage"
+    assert report.impression == "No acute abnormality"
+
+def test_section_extractor_is_reused(report_text):
+    """Test that the section extractor is created once per section & options"""
+    extractor = RadReportExtractor()
+    extractor.extract_history(report_text)
+    extractor.extract_history(report_text)
+    assert len(extractor._section_extractors) == 1
+
+    section_extractor = extractor._get_section_extractor("history")
+    assert isinstance(section_extractor, SectionExtractor)
+    assert section_extractor is extractor._get_section_extractor("history")
+
+    # Different options get their own extractor
+    assert extractor._get_section_extractor("history", flags=0) is not section_extractor
+    assert extractor.extract_history(report_text, flags=0) == ""
+
+def test_changed_options_rebuild_extractor(report_text):
+    """Test that assigning keys or backend after the first call takes effect"""
+    extractor = RadReportExtractor(cache_size=4)
+    assert extractor.extract_history(report_text) == "HISTORY: 25F, dizziness and LOC"
+    section_extractor = extractor._get_section_extractor("history")
+    assert extractor._get_section_extractor("history") is section_extractor
+
+    extractor.section_configs["history"].next_section_keys = ["COMPARISON:"]
+    assert extractor.extract_history(report_text) == (
+        "HISTORY: 25F, dizziness and LOC\n\nTECHNIQUE: CT brain without contrast"
+    )
+
+    # Keys are stored as tuples, in-place changes are not supported
+    config = extractor.section_configs["history"]
+    assert config.next_section_keys == ("COMPARISON:",)
+    with pytest.raises(AttributeError):
+        config.next_section_keys.append("FINDINGS:")
+
+    extractor.backend = "re"
+    assert extractor._section_extractors == {}
+    assert len(extractor._cache) == 0
+    assert extractor._get_section_extractor("history") is not section_extractor
+    extractor.backend = "re2"
+    if is_re2_available():
+        assert extractor._get_section_extractor("history").backend == "re2"
+    else:
+        with pytest.raises(ValueError):
+            extractor._get_section_extractor("history")
+
+def test_unknown_section():
+    """Test error handling for unknown section name"""
+    with pytest.raises(ValueError):
+        RadReportExtractor()._extract_section_by_name("text", "unknown")
+
+def test_cache_size(report_text):
+    """Test memoization of extracted sections"""
+    # Disabled by default
+    extractor = RadReportExtractor()
+    extractor.extract_all(report_text)
+    assert len(extractor._cache) == 0
+
+    extractor = RadReportExtractor(cache_size=2)
+    history = extractor.extract_history(report_text)
+    assert extractor.extract_history(report_text) == history
+    assert len(extractor._cache) == 1
+
+    # Options are part of the cache key
+    assert extractor.extract_history(report_text, include_key=False) == "25F, dizziness and LOC"
+    assert history == "HISTORY: 25F, dizziness and LOC"
+
+    # Least recently used entry is evicted
+    report = extractor.extract_all(report_text)
+    assert len(extractor._cache) == 2
+    assert report == RadReportExtractor().extract_all(report_text)
+
+def test_extract_all_batch(report_text):
+    """Test batch extraction matches extracting one report at a time"""
+    extractor = RadReportExtractor()
+    texts = [report_text, "FINDINGS: Normal\nIMPRESSION: Normal", ""]
+    expected = [extractor.extract_all(text) for text in texts]
+    assert extractor.extract_all_batch(texts) == expected
+    assert extractor.extract_all_batch(iter(texts), verbose=False) == expected
+    assert extractor.extract_all_batch(texts, n_jobs=2) == expected
+    assert extractor.extract_all_batch(texts, include_key=True, n_jobs=2) == [
+        extractor.extract_all(text, include_key=True) for text in texts
+    ]
+    with pytest.raises(ValueError):
+        extractor.extract_all_batch(texts, n_jobs=0)
+
+def test_extractor_pickle(report_text):
+    """Test that extractors are picklable, dropping their compiled patterns"""
+    import pickle
+    extractor = RadReportExtractor(keys_history=["HISTORY:"], cache_size=4)
+    report = extractor.extract_all(report_text)
+    restored = pickle.loads(pickle.dumps(extractor))
+    assert restored._section_extractors == {}
+    assert len(restored._cache) == 0
+    assert restored.extract_all(report_text) == report
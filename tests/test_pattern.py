@@ -1,6 +1,12 @@
 from radreportparser._pattern import (
     _pattern_keys,
     _ensure_string,
+    _literal_keys,
+    _LiteralPattern,
+    _lowercase_pattern,
+    _CaseFoldPattern,
+    _lower_ascii,
+    _sharing_lowered,
 )
 import re
 import pytest
@@ -59,4 +65,202 @@ def test_type_conversion():
     assert _ensure_string(123) == "123"        # integer
     assert _ensure_string(3.14) == "3.14"      # float
     assert _ensure_string(True) == "True"      # boolean
-    assert _ensure_string(None) == ""          # None
\ No newline at end of file
+    assert _ensure_string(None) == ""          # None
+
+def test_pattern_keys_literal_matches_regex():
+    """Test that plain string keys match the same spans as the regex alternation"""
+    keys = ["HISTORY", "HISTORY:", "Findings"]
+    pattern = _pattern_keys(keys, word_boundary=False)
+    assert isinstance(pattern, _LiteralPattern)
+
+    regex = re.compile(rf"({'|'.join(keys)})", re.IGNORECASE)
+    for text in ["history: x findings", "no keys", "FINDINGS HISTORY: HISTORY", "İ HISTORY:"]:
+        assert [m.span() for m in pattern.finditer(text)] == [m.span() for m in regex.finditer(text)]
+        for pos in range(len(text) + 1):
+            match, expected = pattern.search(text, pos), regex.search(text, pos)
+            assert (match and match.span()) == (expected and expected.span())
+
+
+def test_pattern_keys_literal_finditer_many_keys():
+    """Test finditer over many overlapping keys, some matching many times"""
+    keys = ["ab", "b", "abc", "ca", "zz"] + [f"key{i}" for i in range(20)]
+    pattern = _pattern_keys(keys, word_boundary=False, flags=0)
+    regex = re.compile(rf"({'|'.join(keys)})")
+    text = "abcabbab cab key3 key19 abcca " * 5
+    assert [m.span() for m in pattern.finditer(text)] == [m.span() for m in regex.finditer(text)]
+
+
+@pytest.mark.parametrize("word_boundary", [False, True])
+def test_pattern_keys_escaped_literal_matches_regex(word_boundary):
+    """Test that keys with escaped metacharacters match the same spans as the regex"""
+    keys = [r"\*\*HISTORY:\*\*", r"\*\*FINDINGS", r"Dx\ \(final\)"]
+    pattern = _pattern_keys(keys, word_boundary=word_boundary)
+    assert isinstance(pattern, _LiteralPattern)
+
+    joined = "|".join(keys)
+    regex = re.compile(rf"\b({joined})\b" if word_boundary else rf"({joined})", re.IGNORECASE)
+    text = "**History:** x **FINDINGS: a**history:**b y**findings: **findingsz dx (FINAL)z"
+    spans = [m.span() for m in pattern.finditer(text)]
+    assert spans and spans == [m.span() for m in regex.finditer(text)]
+
+
+@pytest.mark.parametrize("flags", [0, re.IGNORECASE])
+def test_pattern_keys_literal_word_boundary_matches_regex(flags):
+    """Test that word-bounded plain string keys match the same spans as the regex"""
+    keys = ["hist", "History:", ":x", "a b", "_id"]
+    pattern = _pattern_keys(keys, word_boundary=True, flags=flags)
+    assert isinstance(pattern, _LiteralPattern)
+
+    regex = re.compile(rf"\b({'|'.join(keys)})\b", flags)
+    texts = [
+        "hist: hhist histtt History:x HISTORY: x",
+        "a b ab a bc _id x_id _id_ :x :xy ::x",
+        "ประวัติhist hist ประวัติ History:ก",
+        "hist",
+    ]
+    for text in texts:
+        assert [m.span() for m in pattern.finditer(text)] == [m.span() for m in regex.finditer(text)]
+        for pos in range(len(text) + 1):
+            match, expected = pattern.search(text, pos), regex.search(text, pos)
+            assert (match and match.span()) == (expected and expected.span())
+
+
+def test_pattern_keys_literal_case_sensitive():
+    """Test case sensitive matching of plain string keys"""
+    pattern = _pattern_keys(["FINDINGS:"], word_boundary=False, flags=0)
+    assert pattern.search("findings: FINDINGS:").start() == 10
+    assert not pattern.search("findings:")
+
+
+def test_literal_keys():
+    """Test detection of plain string keys"""
+    assert _literal_keys(["FINDINGS:", "Report Severity"]) == ("FINDINGS:", "Report Severity")
+    assert _literal_keys([r"\W*finding(s?)\W*"]) is None
+    assert _literal_keys(["a.b"]) is None
+    assert _literal_keys([""]) is None
+    assert _literal_keys(["FINDINGS:"], flags=re.IGNORECASE | re.VERBOSE) is None
+    # Non-ASCII keys need the regex engine for case folding only
+    assert _literal_keys(["ประวัติ"], flags=0) == ("ประวัติ",)
+    assert _literal_keys(["ประวัติ"], flags=re.IGNORECASE) is None
+    # Escaped metacharacters are literal, escaped letters & digits are not
+    assert _literal_keys([r"\*\*HISTORY:\*\*", r"a\.b\ c"]) == ("**HISTORY:**", "a.b c")
+    assert _literal_keys([r"\*\*HISTORY\d"]) is None
+    assert _literal_keys(["HISTORY\\"]) is None
+    assert _literal_keys([re.escape("Dx (final): 1+1")]) == ("Dx (final): 1+1",)
+
+
+def test_pattern_keys_cached():
+    """Test that identical keys & options reuse the compiled pattern"""
+    pattern = _pattern_keys(["history", "indication"])
+    assert _pattern_keys(["history", "indication"]) is pattern
+    assert _pattern_keys(("history", "indication"), flags=int(re.IGNORECASE)) is pattern
+    assert _pattern_keys(["history", "indication"], flags=0) is not pattern
+    assert _pattern_keys(["indication", "history"]) is not pattern
+    # Repeated keys are dropped, keeping the order of first occurrence
+    assert _pattern_keys(["history", "indication", "history"]) is pattern
+
+
+def test_lowercase_pattern():
+    """Test rewriting of patterns for matching lowercased text"""
+    assert _lowercase_pattern(r"[^\w\n]*IMPRESSION[^\w\n]*") == r"[^\w\n]*impression[^\w\n]*"
+    # Escapes, group names & uppercase-only ranges
+    assert _lowercase_pattern(r"\bAB\W\S") == r"\bab\W\S"
+    assert _lowercase_pattern(r"(?P<Key>FOO)(?P=Key)") == r"(?P<Key>foo)(?P=Key)"
+    assert _lowercase_pattern(r"(?<=X)[A-Z]+(?!Y)") == r"(?<=x)[a-z]+(?!y)"
+    assert _lowercase_pattern(r"[0-z]") == r"[0-z]"
+    # Rewrite not known to be equivalent
+    assert _lowercase_pattern(r"[@-Z]") is None
+    assert _lowercase_pattern(r"\x41") is None
+    assert _lowercase_pattern(r"\101") is None
+    assert _lowercase_pattern(r"(?-i:A)") is None
+    assert _lowercase_pattern("ประวัติ") is None
+
+
+@pytest.mark.parametrize("keys", [
+    [r"[^\w\n]*Impression[^\w\n]*", r"Footer"],
+    [r"A[B-D]+", r"(?P<Z>xY)\s+(?P=Z)"],
+    [r"[^A-C]e", r"(?<=Q)r|S(?!t)", r"\WK\B"],
+])
+def test_pattern_keys_casefold_matches_regex(keys):
+    """Test that matching lowercased text gives the same spans as re.IGNORECASE"""
+    import random
+    rng = random.Random(0)
+    for word_boundary in [True, False]:
+        pattern = _pattern_keys(keys, word_boundary=word_boundary)
+        assert isinstance(pattern, _CaseFoldPattern)
+        regex = re.compile(pattern._fallback().pattern, re.IGNORECASE)
+        texts = ["".join(rng.choice("aAbBcCdDeEfFqQrRsStTxXyYkK \n:-ก") for _ in range(30)) for _ in range(300)]
+        for text in texts + ["IMPRESSION: x\nFOOTER", "İmpression: x"]:
+            assert [m.span() for m in pattern.finditer(text)] == [m.span() for m in regex.finditer(text)]
+            pos = rng.randint(0, len(text))
+            match, expected = pattern.search(text, pos), regex.search(text, pos)
+            assert (match and match.span()) == (expected and expected.span())
+
+
+def test_casefold_pattern_compiles_fallback_lazily():
+    """Test the re.IGNORECASE pattern is only compiled for non-ASCII text"""
+    pattern = _CaseFoldPattern(
+        re.compile("impression"), ignorecase=lambda: re.compile("impression", re.IGNORECASE)
+    )
+    assert pattern.search("IMPRESSION: x").span() == (0, 10)
+    assert pattern._ignorecase is None
+    assert pattern.search("ผล IMPRESSION: x").span() == (3, 13)
+    assert pattern._ignorecase is not None
+
+
+def test_lower_ascii_shared_within_call():
+    """Test the lowercased text is shared between searches of one call only"""
+    text = "FINDINGS: Normal. IMPRESSION: Clear."
+    lower = _lower_ascii(text)
+    assert lower == text.lower()
+    assert _lower_ascii(text) is not lower
+    assert _lower_ascii("ผล: Normal") is None
+    with _sharing_lowered(text):
+        lower = _lower_ascii(text)
+        assert _lower_ascii(text) is lower
+        with _sharing_lowered(text):
+            assert _lower_ascii(text) is lower
+        with _sharing_lowered("Other text") as shared:
+            assert _lower_ascii("Other text") is _lower_ascii("Other text")
+        with _sharing_lowered("Other text", shared):
+            assert _lower_ascii("Other text") is shared[1]
+        # Patterns searching the same text agree with the unshared result
+        start = _pattern_keys(["findings:"], word_boundary=False)
+        end = _pattern_keys([r"impression\s*:"], word_boundary=False)
+        assert start.search(text).span() == (0, 9)
+        assert end.search(text, 9).span() == (18, 29)
+    assert _lower_ascii(text) is not lower
+
+
+def test_no_text_retained_after_extract():
+    """Test that no report text is kept once an extraction call returns"""
+    from concurrent.futures import ThreadPoolExecutor
+    from radreportparser import RadReportExtractor, SectionExtractor
+    from radreportparser import _pattern
+    text = "FINDINGS: Normal. IMPRESSION: Clear."
+    extractor = SectionExtractor(start_keys=["FINDINGS:"], end_keys=["IMPRESSION:"])
+    assert extractor.extract(text) == "FINDINGS: Normal."
+    assert extractor.extract_span(text) == (0, 17)
+    assert extractor.extract_all(text) == ["FINDINGS: Normal."]
+    assert RadReportExtractor().extract_all(text).impression == "Clear."
+    assert _pattern._shared_lowered.get() is None
+
+    # Interleaved generators
+    a = "FINDINGS: a IMPRESSION: x FINDINGS: b IMPRESSION: y"
+    b = "FINDINGS: c IMPRESSION: z FINDINGS: d IMPRESSION: w"
+    sections_a, sections_b = extractor.iter_extract(a), extractor.iter_extract(b)
+    assert next(sections_a) == "FINDINGS: a"
+    assert next(sections_b) == "FINDINGS: c"
+    assert _pattern._shared_lowered.get() is None
+    assert list(sections_a) == ["FINDINGS: b"]
+    assert list(sections_b) == ["FINDINGS: d"]
+    assert _pattern._shared_lowered.get() is None
+
+    # Concurrent threads
+    def extract(i):
+        section = extractor.extract(f"FINDINGS: {i} IMPRESSION: x")
+        return section, _pattern._shared_lowered.get()
+
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(extract, range(200)))
+    assert results == [(f"FINDINGS: {i}", None) for i in range(200)]
@@ -0,0 +1,42 @@
+import json
+import pytest
+from dataclasses import asdict, fields
+from radreportparser import RadReport
+
+def test_to_dict():
+    """Test conversion to dictionary"""
+    report = RadReport(title="CT BRAIN", findings="Normal")
+    assert report.to_dict() == asdict(report)
+    assert list(report.to_dict()) == [f.name for f in fields(RadReport)]
+    assert report.to_dict(exclude_none=True) == {"title": "CT BRAIN", "findings": "Normal"}
+
+def test_to_json():
+    """Test conversion to JSON string"""
+    report = RadReport(title="CT BRAIN", findings="Normal")
+    assert json.loads(report.to_json()) == asdict(report)
+    assert report.to_json(exclude_none=True) == '{"title": "CT BRAIN", "findings": "Normal"}'
+    assert report.to_json(indent=2).startswith('{\n  "title": "CT BRAIN"')
+
+def test_to_json_orjson():
+    """Test JSON conversion with the orjson backend"""
+    pytest.importorskip("orjson")
+    report = RadReport(title="CT BRAIN", findings="ปกติ")
+    assert json.loads(report.to_json(backend="orjson")) == asdict(report)
+    assert report.to_json(exclude_none=True, backend="orjson") == '{"title":"CT BRAIN","findings":"ปกติ"}'
+    assert json.loads(report.to_json(backend="orjson", indent=2, sort_keys=True)) == asdict(report)
+
+    with pytest.raises(ValueError):
+        report.to_json(backend="orjson", indent=4)
+    with pytest.raises(ValueError):
+        report.to_json(backend="orjson", ensure_ascii=False)
+    with pytest.raises(ValueError):
+        report.to_json(backend="invalid")
+
+def test_slots():
+    """Test that reports don't carry a per-instance `__dict__`"""
+    report = RadReport(title="CT BRAIN")
+    assert not hasattr(report, "__dict__")
+    report.impression = "Normal"
+    assert report.to_dict()["impression"] == "Normal"
+    with pytest.raises(AttributeError):
+        report.unknown = "value"
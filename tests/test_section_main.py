@@ -1,6 +1,6 @@
 import pytest
 import re
-from radreportparser import SectionExtractor
+from radreportparser import SectionExtractor, is_re2_available
 
 # Test Data
 MINIMAL_REPORT_TEXT = """EMERGENCY CT BRAIN
@@ -27,59 +27,35 @@ MINIMAL_REPORT_MD = """**EMERGENCY CT BRAIN**
 
 **IMPRESSION:** No acute abnormality"""
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def report_text():
     return MINIMAL_REPORT_TEXT
 
-@pytest.fixture
-def report_md():
-    return MINIMAL_REPORT_MD
+# Basic Tests with Plain Text & Markdown Report
 
-# Basic Tests with Plain Text Report
+FINDINGS_BODY = "Normal study\n- No hemorrhage\n- No mass"
 
-def test_extract_section_basic(report_text):
-    """Test basic section extraction from plain text"""
-    # Extract HISTORY section
-    extractor = SectionExtractor(start_keys=["HISTORY:"], end_keys=["TECHNIQUE:"], include_start_keys=True)
-    history = extractor.extract(report_text)
-    assert history.strip() == "HISTORY: 25F, dizziness and LOC"
-    
-    # Extract FINDINGS section
-    extractor = SectionExtractor(start_keys=["FINDINGS:"], end_keys=["IMPRESSION:"], include_start_keys=True)
-    findings = extractor.extract(report_text)
-    assert "FINDINGS: Normal study" in findings
-    assert "No hemorrhage" in findings
-    assert "No mass" in findings
-
-def test_extract_section_without_start_key(report_text):
-    """Test extraction without including start key"""
-    extractor = SectionExtractor(start_keys=["FINDINGS:"], end_keys=["IMPRESSION:"], include_start_keys=False)
-    findings = extractor.extract(report_text)
-    assert not findings.startswith("FINDINGS:")
-    assert "Normal study" in findings
-    assert "No hemorrhage" in findings
-
-def test_extract_last_section(report_text):
-    """Test extracting the last section (no end key)"""
-    extractor = SectionExtractor(start_keys=["IMPRESSION:"], end_keys=None, include_start_keys=True)
-    impression = extractor.extract(report_text)
-    assert impression.strip() == "IMPRESSION: No acute abnormality"
-
-# Tests with Markdown Report
-
-def test_extract_section_markdown(report_md):
-    """Test section extraction from markdown formatted text"""
-    # Extract HISTORY section
-    extractor = SectionExtractor(start_keys=[r"\*\*HISTORY:\*\*"], end_keys=[r"\*\*TECHNIQUE:\*\*"], include_start_keys=True, word_boundary=False)
-    history = extractor.extract(report_md)
-    assert history.strip() == "**HISTORY:** 25F, dizziness and LOC"
-    
-    # Extract FINDINGS section with markdown formatting
-    extractor = SectionExtractor(start_keys=[r"\*\*FINDINGS:\*\*"], end_keys=[r"\*\*IMPRESSION:\*\*"], include_start_keys=True)
-    findings = extractor.extract(report_md)
-    assert "**FINDINGS:** Normal study" in findings
-    assert "- No hemorrhage" in findings
-    assert "- No mass" in findings
+# (report, start_keys, end_keys, include_start_keys, expected section)
+SECTION_CASES = [
+    (MINIMAL_REPORT_TEXT, ["HISTORY:"], ["TECHNIQUE:"], True, "HISTORY: 25F, dizziness and LOC"),
+    (MINIMAL_REPORT_TEXT, ["FINDINGS:"], ["IMPRESSION:"], True, "FINDINGS: " + FINDINGS_BODY),
+    # Without including start key
+    (MINIMAL_REPORT_TEXT, ["FINDINGS:"], ["IMPRESSION:"], False, FINDINGS_BODY),
+    # Last section (no end key)
+    (MINIMAL_REPORT_TEXT, ["IMPRESSION:"], None, True, "IMPRESSION: No acute abnormality"),
+    (MINIMAL_REPORT_MD, [r"\*\*HISTORY:\*\*"], [r"\*\*TECHNIQUE:\*\*"], True, "**HISTORY:** 25F, dizziness and LOC"),
+    (MINIMAL_REPORT_MD, [r"\*\*FINDINGS:\*\*"], [r"\*\*IMPRESSION:\*\*"], True, "**FINDINGS:** " + FINDINGS_BODY),
+]
+
+@pytest.mark.parametrize(
+    "report, start_keys, end_keys, include_start_keys, expected",
+    SECTION_CASES,
+    ids=["history", "findings", "findings-without-start-key", "last-section", "md-history", "md-findings"],
+)
+def test_extract_section(report, start_keys, end_keys, include_start_keys, expected):
+    """Test section extraction from plain text and markdown formatted reports"""
+    extractor = SectionExtractor(start_keys=start_keys, end_keys=end_keys, include_start_keys=include_start_keys)
+    assert extractor.extract(report) == expected
 
 def test_word_boundary_behavior():
     """Test word boundary behavior with similar section names"""
@@ -132,7 +108,7 @@ def test_empty_and_whitespace():
 
 def test_invalid_match_strategy():
     """Test error handling for invalid match strategy"""
-    with pytest.raises(ValueError):
+    with pytest.raises(ValueError, match="Must be one of: greedy, sequential"):
         SectionExtractor(start_keys=["START:"], end_keys=["END:"], match_strategy="invalid")
 
 def test_no_start_keys():
@@ -185,4 +161,130 @@ IMPRESSION: End"""
     assert "Line 2" in result
     assert "Bullet point 1" in result
     assert "Bullet point 2" in result
-    assert "IMPRESSION:" not in result
\ No newline at end of file
+    assert "IMPRESSION:" not in result
+
+@pytest.mark.parametrize("backend", [
+    "re",
+    pytest.param("re2", marks=pytest.mark.skipif(not is_re2_available(), reason="re2 is not installed")),
+])
+def test_verbose_multiple_start_matches(capsys, backend):
+    """Test message when the start key appears more than once"""
+    text = "FINDINGS: First\nFINDINGS: Second"
+    extractor = SectionExtractor(start_keys=["FINDINGS:"], end_keys=None, backend=backend)
+
+    assert extractor.extract(text, verbose=False) == text
+    assert capsys.readouterr().out == ""
+
+    assert extractor.extract(text) == text
+    assert "appear 2 times" in capsys.readouterr().out
+
+@pytest.mark.parametrize("match_strategy", ["greedy", "sequential"])
+@pytest.mark.parametrize("include_start_keys", [True, False])
+def test_extract_span(report_text, match_strategy, include_start_keys):
+    """Test that the section span gives the same text as `extract()`"""
+    for start_keys, end_keys in [
+        (["HISTORY:"], ["TECHNIQUE:"]),
+        (["FINDINGS:"], ["IMPRESSION:"]),
+        (["IMPRESSION:"], None),
+        (None, ["HISTORY:"]),
+    ]:
+        extractor = SectionExtractor(
+            start_keys=start_keys,
+            end_keys=end_keys,
+            include_start_keys=include_start_keys,
+            match_strategy=match_strategy,
+        )
+        start, end = extractor.extract_span(report_text)
+        assert report_text[start:end] == extractor.extract(report_text)
+
+    extractor = SectionExtractor(start_keys=["COMPARISON:"], end_keys=None, match_strategy=match_strategy)
+    assert extractor.extract_span(report_text) is None
+
+@pytest.mark.parametrize("match_strategy", ["greedy", "sequential"])
+def test_extract_all_shared_end(match_strategy):
+    """Test sections whose start keys share the same end key"""
+    text = "FINDING: a FINDING: b IMPRESSION: x FINDING: c CONCLUSION: y IMPRESSION: z FINDING: d"
+    extractor = SectionExtractor(
+        start_keys=["FINDING:"],
+        end_keys=["IMPRESSION:", "CONCLUSION:"],
+        include_start_keys=False,
+        match_strategy=match_strategy,
+    )
+    expected = {
+        "greedy": ["a FINDING: b", "b", "c", "d"],
+        "sequential": ["a FINDING: b", "b", "c CONCLUSION: y", "d"],
+    }
+    assert extractor.extract_all(text) == expected[match_strategy]
+
+def test_extract_all_batch():
+    """Test batch extraction and pickling of the extractor"""
+    import pickle
+    texts = ["FINDING: a IMPRESSION: x FINDING: b", "No sections", "finding: c"]
+    for match_strategy in ["greedy", "sequential"]:
+        extractor = SectionExtractor(
+            start_keys=["FINDING:"],
+            end_keys=["IMPRESSION:"],
+            match_strategy=match_strategy,
+        )
+        expected = [extractor.extract_all(text) for text in texts]
+        assert expected == [["FINDING: a", "FINDING: b"], [], ["finding: c"]]
+        assert extractor.extract_all_batch(texts) == expected
+        assert extractor.extract_all_batch(texts, n_jobs=2) == expected
+
+        restored = pickle.loads(pickle.dumps(extractor))
+        assert repr(restored) == repr(extractor)
+        assert [restored.extract_all(text) for text in texts] == expected
+
+def test_extractor_slots():
+    """Test that extractors don't carry a per-instance `__dict__`"""
+    extractor = SectionExtractor(start_keys=["FINDINGS:"], end_keys=["IMPRESSION:"])
+    assert not hasattr(extractor, "__dict__")
+    with pytest.raises(AttributeError):
+        extractor.other = 1
+
+def test_iter_extract():
+    """Test lazy extraction yields the same sections as `extract_all()`"""
+    text = "FINDING: a IMPRESSION: x FINDING: b FINDING: c IMPRESSION: y"
+    for match_strategy in ["greedy", "sequential"]:
+        extractor = SectionExtractor(
+            start_keys=["FINDING:"],
+            end_keys=["IMPRESSION:"],
+            match_strategy=match_strategy,
+        )
+        sections = extractor.iter_extract(text)
+        assert next(sections) == "FINDING: a"
+        assert list(sections) == extractor.extract_all(text)[1:]
+        assert list(extractor.iter_extract("No sections")) == []
+
+def test_assigned_options_recompile():
+    """Test that options assigned after creation change the extraction"""
+    text = "FINDINGS: a IMPRESSION: b HISTORY: c"
+    extractor = SectionExtractor(start_keys=["FINDINGS:"], end_keys=["IMPRESSION:"])
+    assert extractor.extract(text) == "FINDINGS: a"
+    extractor.start_keys = ["HISTORY:"]
+    assert extractor.extract(text) == "HISTORY: c"
+    extractor.match_strategy = "sequential"
+    extractor.end_keys = None
+    assert extractor.extract(text) == "HISTORY: c"
+    # Only the patterns of the sequential strategy are compiled
+    assert extractor._start_pattern is None and extractor._end_pattern is None
+    assert len(extractor._start_patterns_sequential) == 1
+    extractor.flags = 0
+    assert extractor.extract(text.lower()) == ""
+    with pytest.raises(ValueError):
+        extractor.match_strategy = "bogus"
+    assert extractor.match_strategy == "sequential"
+
+@pytest.mark.parametrize("match_strategy", ["greedy", "sequential"])
+def test_none_keys(match_strategy):
+    """Test extraction without start or end keys for both strategies"""
+    text = " HISTORY: x FINDINGS: y "
+    no_start = SectionExtractor(start_keys=None, end_keys=["FINDINGS:"], match_strategy=match_strategy)
+    no_end = SectionExtractor(start_keys=["FINDINGS:"], end_keys=None, match_strategy=match_strategy)
+    no_keys = SectionExtractor(start_keys=None, end_keys=None, match_strategy=match_strategy)
+    assert no_start.extract(text) == "HISTORY: x"
+    assert no_start.extract_all(text) == ["HISTORY: x"]
+    assert no_end.extract(text) == "FINDINGS: y"
+    assert no_end.extract_all(text) == ["FINDINGS: y"]
+    assert no_keys.extract(text) == "HISTORY: x FINDINGS: y"
+    assert no_keys.extract_span(text) == (1, 23)